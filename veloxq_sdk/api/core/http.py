@@ -1,6 +1,7 @@
 import atexit
 import typing as t
 from contextlib import contextmanager, suppress
+from threading import Lock
 
 import httpx
 from websockets.sync.client import ClientConnection, connect
@@ -16,8 +17,8 @@ class RestClient(httpx.Client):
     def __init__(self) -> None:
         config = VeloxQAPIConfig.instance()
         super().__init__(verify=config.ssl_context)
-        config.observe(self._update_token, names='token')
-        config.observe(self._update_url, names='url')
+        config.observe(self._on_config_change, names=('token', 'url'))
+        self._token = config.token
         self.headers[self.API_KEY_HEADER] = config.token
         self.base_url = config.url
         self.event_hooks = {
@@ -25,13 +26,13 @@ class RestClient(httpx.Client):
         }
         self.timeout = httpx.Timeout(connect=5, read=30, write=15, pool=10)
 
-    def _update_token(self, change: dict) -> None:
-        """Update the API token in the headers."""
-        self.headers[self.API_KEY_HEADER] = change['new']
-
-    def _update_url(self, change: dict) -> None:
-        """Update the base URL in the client."""
-        self.base_url = change['new']
+    def _on_config_change(self, change: dict) -> None:
+        """Update the API token or base URL when the configuration changes."""
+        if change['name'] == 'token':
+            self._token = change['new']
+            self.headers[self.API_KEY_HEADER] = change['new']
+        else:
+            self.base_url = change['new']
 
     @contextmanager
     def open_ws(self, path: str) -> t.Iterator[ClientConnection]:
@@ -44,7 +45,7 @@ class RestClient(httpx.Client):
             connect: A WebSocket connection object.
 
         """
-        token = self.headers.get(self.API_KEY_HEADER)
+        token = self._token
         if not token:
             msg = (f'Missing required header: {self.API_KEY_HEADER}.'
                    ' Make sure that the token is set in the configuration.')
@@ -82,10 +83,36 @@ class _RestClientGetter:
         return _RestClientGetter.client
 
 
+# First accessed from multipart upload workers, so creation must be guarded.
+_storage_client_lock = Lock()
+
+
+class _StorageClientGetter:
+    """Shared client for presigned storage URLs.
+
+    Kept apart from `RestClient` so the API key is never sent to the storage
+    provider, while part uploads still reuse pooled keep-alive connections.
+    """
+
+    client = None
+
+    def __get__(self, *args, **kwargs) -> httpx.Client:
+        if _StorageClientGetter.client is None:
+            with _storage_client_lock:
+                if _StorageClientGetter.client is None:
+                    # Default verification on purpose: `ssl_context` configures
+                    # the VeloxQ API endpoint, not the public storage provider.
+                    client = httpx.Client(timeout=3600)
+                    atexit.register(client.close)
+                    _StorageClientGetter.client = client
+        return _StorageClientGetter.client
+
+
 class ClientMixin:
     """Mixin class to provide HTTP client functionality."""
 
     _http = _RestClientGetter()
+    _storage = _StorageClientGetter()
 
     http = _http
 
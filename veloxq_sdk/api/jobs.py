@@ -17,7 +17,6 @@ from pathlib import Path
 from shutil import copyfile
 from tempfile import gettempdir
 
-import h5py
 import numpy as np
 from dateutil.parser import isoparse
 from dimod.sampleset import SampleSet
@@ -27,6 +26,9 @@ from pydantic import BeforeValidator, Field
 from veloxq_sdk.api.core.base import BaseModel, BasePydanticModel, build_adapters
 from veloxq_sdk.api.problems import File
 
+if t.TYPE_CHECKING:
+    import h5py
+
 
 class LogCategory(Enum):
     """Enumerate all possible categories for job logs.
@@ -419,6 +421,8 @@ class Job(BaseModel):
         Returns:
             VeloxSampleSet: A SampleSet object containing the job's result data.
         """
+        import h5py
+
         temp_file = self._get_temp_result()
         with h5py.File(temp_file, 'r') as file:
             return VeloxSampleSet.from_result(file)
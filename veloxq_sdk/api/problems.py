@@ -8,18 +8,23 @@ and managing files and problems within the VeloxQ platform.
 from __future__ import annotations
 
 import hashlib
+import io
 import logging
+import math
 import os
+import sys
+import time
 import typing as t
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from threading import Lock
 from urllib.parse import urlparse
 
-import h5py
-import httpx
 import numpy as np
+import numpy.typing as npt
 from dimod import BinaryQuadraticModel
 from dimod.sampleset import SampleSet
 from dimod.views.quadratic import Linear, Quadratic
@@ -37,6 +42,49 @@ _logger = logging.getLogger(__name__)
 def _is_azure_blob_url(url: str) -> bool:
     return (urlparse(url).netloc or "").endswith(".blob.core.windows.net")
 
+
+def _is_scipy_sparse(obj: t.Any) -> bool:
+    # scipy is optional: a sparse matrix can only exist if it was imported.
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(obj)
+
+
+def _iter_chunks(content: t.IO, chunk_size: int) -> t.Iterator[bytes | memoryview]:
+    """Yield successive chunks of `content`.
+
+    Binary streams are read into one reused buffer and yielded as views, so
+    each chunk must be consumed before the next is requested.
+    """
+    if not hasattr(content, "readinto"):
+        while data := content.read(chunk_size):
+            yield data
+        return
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while size := content.readinto(buffer):
+        yield view[:size]
+
+
+def _read_range(
+    source: Path | t.BinaryIO,
+    offset: int,
+    length: int,
+    *,
+    lock: Lock | None = None,
+) -> bytes:
+    """Read `length` bytes at `offset` from a local path or a seekable stream.
+
+    Paths are reopened on every call so parts can be read concurrently; shared
+    streams are guarded by `lock` since seek and read must happen together.
+    """
+    if isinstance(source, Path):
+        with source.open("rb") as f:
+            f.seek(offset)
+            return f.read(length)
+    with lock or nullcontext():
+        source.seek(offset)
+        return source.read(length)
+
 InstanceLike = t.Union[
     "InstanceDict",
     "InstanceTuple",
@@ -57,16 +105,26 @@ BiasesType = t.Union[
     t.Dict[VariableType, BiasType],
     Linear,
 ]
-CouplingsType = t.Union[
+_DenseCouplingsType = t.Union[
     t.List[t.List[CouplingType]],
     np.ndarray[tuple[int, int], np.dtype[np.number]],
     t.Dict[t.Tuple[VariableType, ...], CouplingType],
     Quadratic,
 ]
 
+if t.TYPE_CHECKING:
+    from scipy.sparse import sparray, spmatrix
+
+    # scipy is optional, so its sparse types only join the alias for type
+    # checkers; at runtime the alias must resolve without it.
+    CouplingsType = t.Union[_DenseCouplingsType, sparray, spmatrix]
+else:
+    CouplingsType = _DenseCouplingsType
+
 InstanceTuple = t.Tuple[BiasesType, CouplingsType]
 
 if t.TYPE_CHECKING:
+
     class _NormalizedIsingModel(t.TypedDict):
         biases: np.ndarray[tuple[int], np.dtype[np.number]]
         rows: np.ndarray[tuple[int], np.dtype[np.integer]]
@@ -77,9 +135,52 @@ if t.TYPE_CHECKING:
         size: int
         offset: float
 
+    # Content key shared by identical data (None unless the file name is
+    # derived from the data itself) and the deferred upload.
+    _UploadPlan = tuple[t.Optional[str], t.Callable[[], "File"]]
+
 
 SPARSE_THRESHOLD = 0.15
 
+# Seconds a file found by name is reused before the server is asked again.
+EXISTING_FILE_CACHE_TTL = 30.0
+EXISTING_FILE_CACHE_SIZE = 1024
+
+# Deflate is part of every HDF5 build, so the solver can read compressed
+# datasets without extra filter plugins; level 1 with byte shuffling keeps
+# compression cheap while shrinking the upload considerably.
+HDF5_COMPRESSION: dict[str, t.Any] = {
+    "compression": "gzip",
+    "compression_opts": 1,
+    "shuffle": True,
+}
+
+# Target chunk size: large enough to keep the chunk index small, small
+# enough to fit the default 1 MiB HDF5 chunk cache.
+HDF5_CHUNK_BYTES = 1024 * 1024
+HDF5_CHUNK_MIN_SIZE = 1000
+
+
+def _chunked_storage(
+    data: np.ndarray, dtype: npt.DTypeLike | None = None
+) -> dict[str, t.Any]:
+    """Dataset creation options for `data` stored as `dtype`.
+
+    Arrays above `HDF5_CHUNK_MIN_SIZE` elements are split into chunks of about
+    `HDF5_CHUNK_BYTES` (near-square tiles for matrices) and compressed; smaller
+    ones stay contiguous since filters only apply to chunked layouts.
+    """
+    if data.size <= HDF5_CHUNK_MIN_SIZE or data.ndim not in (1, 2):
+        return {"chunks": None}
+    itemsize = np.dtype(dtype if dtype is not None else data.dtype).itemsize
+    items = max(1, HDF5_CHUNK_BYTES // itemsize)
+    if data.ndim == 2:
+        ncols = min(data.shape[1], max(1, math.isqrt(items)))
+        chunks = (min(data.shape[0], max(1, items // ncols)), ncols)
+    else:
+        chunks = (min(data.shape[0], items),)
+    return {"chunks": chunks, **HDF5_COMPRESSION}
+
 
 class InstanceDict(t.TypedDict):
     """A dictionary type for Ising-model instances.
@@ -273,7 +374,7 @@ class File(BaseModel):
 
         def upload(
             self,
-            file_path: Path,
+            source: Path | t.BinaryIO,
             callback: t.Callable[[int], None] = lambda _: None,
         ) -> File:
             config = VeloxQAPIConfig.instance()
@@ -293,8 +394,7 @@ class File(BaseModel):
                         map(
                             _callback,
                             executor.map(
-                                self.upload_part,
-                                [file_path] * len(self.chunks),
+                                partial(self.upload_part, source, lock=Lock()),
                                 self.chunks,
                             ),
                         )
@@ -311,7 +411,11 @@ class File(BaseModel):
                 raise
 
         def upload_part(
-            self, file_path: Path, chunk: _PreasignedUploadChunk
+            self,
+            source: Path | t.BinaryIO,
+            chunk: _PreasignedUploadChunk,
+            *,
+            lock: Lock | None = None,
         ) -> tuple[dict[str, t.Any], int]:
             if datetime.now(timezone.utc) > chunk["expires_at"]:
                 msg = (
@@ -323,10 +427,8 @@ class File(BaseModel):
             chunk_size = config.multipart_upload_chunk_size
             offset = (chunk["part_number"] - 1) * chunk_size
             length = min(chunk_size, self.file.size - offset)
-            with file_path.open("rb") as f:
-                f.seek(offset)
-                data = f.read(length)
-            response = httpx.put(chunk["upload_url"], content=data, timeout=3600)
+            data = _read_range(source, offset, length, lock=lock)
+            response = self.file._storage.put(chunk["upload_url"], content=data)
             response.raise_for_status()
             part: dict[str, t.Any] = {"part_number": chunk["part_number"]}
             etag = response.headers.get("ETag")
@@ -348,7 +450,7 @@ class File(BaseModel):
 
         def upload(
             self,
-            file_path: Path,
+            source: Path | t.BinaryIO,
             callback: t.Callable[[int], None] = lambda _: None,
         ) -> File:
             headers = {}
@@ -362,10 +464,9 @@ class File(BaseModel):
                         "upload URL and retry the upload."
                     )
                     raise ValueError(msg)
-                with file_path.open("rb") as f:
-                    data = f.read()
-                httpx.put(
-                    self.upload_url, content=data, headers=headers, timeout=3600
+                data = _read_range(source, 0, self.file.size)
+                self.file._storage.put(
+                    self.upload_url, content=data, headers=headers
                 ).raise_for_status()
                 callback(len(data))
                 response = self.file._http.post(
@@ -381,6 +482,14 @@ class File(BaseModel):
         t.Union[_PreassignedUploader, _PreassignedChunkUploader],
     )
 
+    _existing_files: t.ClassVar[
+        dict[tuple[str, str, t.Optional[str], str], tuple[float, File]]
+    ] = {}
+    _existing_files_lock: t.ClassVar[Lock] = Lock()
+    _upload_locks: t.ClassVar[
+        dict[tuple[str, str, t.Optional[str], str], tuple[Lock, int]]
+    ] = {}
+
     @property
     def is_temporary(self) -> bool:
         """True when the file is not attached to any problem (problem=NULL)."""
@@ -412,7 +521,7 @@ class File(BaseModel):
             ws_endpoint = f"problems/{self.problem_id}/files/{self.id}/upload/ws"
         try:
             with self.http.open_ws(ws_endpoint) as ws:
-                while data := content.read(chunk_size):
+                for data in _iter_chunks(content, chunk_size):
                     ws.send(data)
                     ws.recv()
                     upload_callback(len(data))
@@ -444,6 +553,7 @@ class File(BaseModel):
 
     def cancel(self) -> None:
         """Cancel the file upload on the VeloxQ platform."""
+        self._forget()
         response = self._http.delete(f"files/{self.id}/cancel")
         response.raise_for_status()
         self.refresh()
@@ -468,6 +578,7 @@ class File(BaseModel):
 
         The blob is removed from storage and the entry erased from the database.
         """
+        self._forget()
         response = self._http.delete(f"files/{self.id}")
         response.raise_for_status()
 
@@ -621,6 +732,80 @@ class File(BaseModel):
             return existing_files[0]
         return None
 
+    @classmethod
+    def _find_existing(cls, name: str, problem: Problem | None) -> File | None:
+        """Look up a file by exact name, reusing recent hits.
+
+        Used by the `from_*` constructors to skip re-uploading known files.
+        Only hits are cached, for `EXISTING_FILE_CACHE_TTL` seconds, and
+        entries are dropped when the file is deleted or canceled here.
+        """
+        key = cls._existing_key(problem.id if problem is not None else None, name)
+        with cls._existing_files_lock:
+            cached = cls._existing_files.get(key)
+            if cached is not None:
+                found_at, file = cached
+                if time.monotonic() - found_at < EXISTING_FILE_CACHE_TTL:
+                    return file
+                cls._existing_files.pop(key, None)
+        file = cls.get_file(name=name, problem=problem)
+        if file is not None:
+            cls._remember(file)
+        return file
+
+    @classmethod
+    def _remember(cls, file: File) -> File:
+        """Record a file as existing on the server for `_find_existing`."""
+        key = cls._existing_key(file.problem_id, file.name)
+        with cls._existing_files_lock:
+            cache = cls._existing_files
+            if len(cache) >= EXISTING_FILE_CACHE_SIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = (time.monotonic(), file)
+        return file
+
+    def _forget(self) -> None:
+        """Drop this file from the `_find_existing` cache."""
+        key = self._existing_key(self.problem_id, self.name)
+        with self._existing_files_lock:
+            self._existing_files.pop(key, None)
+
+    @staticmethod
+    def _existing_key(
+        problem_id: str | None, name: str
+    ) -> tuple[str, str, str | None, str]:
+        """Cache key for `_existing_files`.
+
+        Scoped to the configured server and token, so switching either never
+        returns a file id that belongs to another deployment or account.
+        """
+        config = VeloxQAPIConfig.instance()
+        return (config.url, config.token, problem_id, name)
+
+    @classmethod
+    @contextmanager
+    def _upload_lock(cls, name: str, problem: Problem | None) -> t.Iterator[None]:
+        """Serialize lookup and upload of one file name across threads.
+
+        Concurrent callers would otherwise all miss `_find_existing` and race
+        `create_direct`, which rejects an upload already in flight; waiting
+        callers find the finished upload instead, as sequential calls would.
+        """
+        key = cls._existing_key(problem.id if problem is not None else None, name)
+        with cls._existing_files_lock:
+            lock, users = cls._upload_locks.get(key, (Lock(), 0))
+            cls._upload_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with cls._existing_files_lock:
+                lock, users = cls._upload_locks[key]
+                if users > 1:
+                    cls._upload_locks[key] = (lock, users - 1)
+                else:
+                    del cls._upload_locks[key]
+
     @classmethod
     def from_id(cls, file_id: str) -> File:
         """Get a File instance using a file's ID.
@@ -675,53 +860,149 @@ class File(BaseModel):
             TypeError: If the instance type is unrecognized.
 
         """
-        if isinstance(instance, File):
-            if init_state is not None:
-                _logger.warning(
-                    'Cannot pass initial state when using a File instance'
-                )
-            return instance
-        if isinstance(instance, (Path, str)):
-            if init_state is not None:
-                _logger.warning(
-                    'Cannot pass initial state when using instance path'
-                )
-            return cls.from_path(
-                path=instance,
-                name=name,
-                problem=problem,
-                force=force,
+        _, upload = cls._plan_instance(
+            instance, name, problem, init_state=init_state, force=force
+        )
+        return upload()
+
+    @classmethod
+    def _plan_instance(
+        cls,
+        instance: InstanceLike,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+    ) -> _UploadPlan:
+        """Resolve the content key for `from_instance` and defer the upload.
+
+        Lets batch callers find identical instances and upload each of them
+        once. Only hash-named Ising data has a key: an explicit name or a path
+        says nothing about the content. Arguments and errors are those of
+        `from_instance`.
+        """
+        loader = _INSTANCE_LOADERS.get(type(instance))
+        if loader is None:
+            # Subclasses miss the exact-type lookup; fall back to the ordered scan.
+            loader = next(
+                (
+                    loader
+                    for base, loader in _INSTANCE_LOADERS.items()
+                    if isinstance(instance, base)
+                ),
+                None,
             )
-        if isinstance(instance, BinaryQuadraticModel):
-            return cls.from_bqm(
-                bqm=instance,
-                name=name,
-                problem=problem,
-                init_state=init_state,
-                force=force,
+        if loader is None:
+            msg = (
+                f"Unsupported instance type: {type(instance)}. "
+                "Expected a File, Path, str, dict, or tuple."
             )
-        if isinstance(instance, dict):
-            return cls.from_dict(
-                data=instance,
-                name=name,
-                problem=problem,
-                init_state=init_state,
-                force=force,
+            raise TypeError(msg)
+        return getattr(cls, loader)(
+            instance, name, problem, init_state=init_state, force=force
+        )
+
+    @classmethod
+    def _plan_file_instance(
+        cls,
+        instance: File,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+    ) -> _UploadPlan:
+        """`from_instance` loader for existing File objects."""
+        if init_state is not None:
+            _logger.warning(
+                'Cannot pass initial state when using a File instance'
             )
-        if isinstance(instance, tuple):
-            return cls.from_tuple(
-                data=instance,
-                name=name,
-                problem=problem,
-                init_state=init_state,
-                force=force,
+        return None, lambda: instance
+
+    @classmethod
+    def _plan_path_instance(
+        cls,
+        instance: Path | str,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+    ) -> _UploadPlan:
+        """`from_instance` loader for local file paths."""
+        if init_state is not None:
+            _logger.warning(
+                'Cannot pass initial state when using instance path'
             )
+        return cls._plan_path(
+            path=instance,
+            name=name,
+            problem=problem,
+            force=force,
+        )
 
-        msg = (
-            f"Unsupported instance type: {type(instance)}. "
-            "Expected a File, Path, str, dict, or tuple."
+    @classmethod
+    def _plan_dict_instance(
+        cls,
+        instance: InstanceDict,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+    ) -> _UploadPlan:
+        """`from_instance` loader for Ising dictionaries."""
+        return cls._plan_ising(
+            biases=instance["biases"],
+            couplings=instance["couplings"],
+            name=name,
+            problem=problem,
+            init_state=init_state,
+            force=force,
+        )
+
+    @classmethod
+    def _plan_tuple_instance(
+        cls,
+        instance: InstanceTuple,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+    ) -> _UploadPlan:
+        """`from_instance` loader for (biases, couplings) tuples."""
+        return cls._plan_ising(
+            biases=instance[0],
+            couplings=instance[1],
+            name=name,
+            problem=problem,
+            init_state=init_state,
+            force=force,
+        )
+
+    @classmethod
+    def _plan_bqm_instance(
+        cls,
+        instance: BinaryQuadraticModel,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+    ) -> _UploadPlan:
+        """`from_instance` loader for Binary Quadratic Models."""
+        ising = instance.spin
+        return cls._plan_ising(
+            biases=ising.linear,
+            couplings=ising.quadratic,
+            name=name,
+            problem=problem,
+            init_state=init_state,
+            force=force,
+            offset=ising.offset,
         )
-        raise TypeError(msg)
 
     @classmethod
     def from_dict(
@@ -747,14 +1028,10 @@ class File(BaseModel):
             File: A File object representing the newly created Ising data file.
 
         """
-        return cls.from_ising(
-            biases=data["biases"],
-            couplings=data["couplings"],
-            name=name,
-            problem=problem,
-            init_state=init_state,
-            force=force,
+        _, upload = cls._plan_dict_instance(
+            data, name, problem, init_state=init_state, force=force
         )
+        return upload()
 
     @classmethod
     def from_tuple(
@@ -781,14 +1058,10 @@ class File(BaseModel):
             File: A newly created File containing the specified Ising data.
 
         """
-        return cls.from_ising(
-            biases=data[0],
-            couplings=data[1],
-            name=name,
-            problem=problem,
-            init_state=init_state,
-            force=force,
+        _, upload = cls._plan_tuple_instance(
+            data, name, problem, init_state=init_state, force=force
         )
+        return upload()
 
     @classmethod
     def from_bqm(
@@ -814,17 +1087,10 @@ class File(BaseModel):
             File: The resulting File object.
 
         """
-        ising = bqm.spin
-
-        return cls.from_ising(
-            biases=ising.linear,
-            couplings=ising.quadratic,
-            name=name,
-            problem=problem,
-            init_state=init_state,
-            force=force,
-            offset=ising.offset,
+        _, upload = cls._plan_bqm_instance(
+            bqm, name, problem, init_state=init_state, force=force
         )
+        return upload()
 
     @classmethod
     def from_ising(
@@ -841,8 +1107,8 @@ class File(BaseModel):
     ) -> File:
         """Create a File instance from Ising model.
 
-        A temporary HDF5 file is created to store the Ising model data.
-        The file is then uploaded to the VeloxQ platform, and a File object is returned.
+        The Ising model data is written to an in-memory HDF5 file, which
+        is then uploaded to the VeloxQ platform, and a File object is returned.
 
         Args:
             biases (BiasesType): The bias terms in the Ising model.
@@ -857,33 +1123,66 @@ class File(BaseModel):
             File: The resulting File object.
 
         """
+        _, upload = cls._plan_ising(
+            biases,
+            couplings,
+            name,
+            problem,
+            init_state=init_state,
+            force=force,
+            offset=offset,
+            upload_callback=upload_callback,
+        )
+        return upload()
+
+    @classmethod
+    def _plan_ising(
+        cls,
+        biases: BiasesType,
+        couplings: CouplingsType,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+        offset: float = 0.0,
+        upload_callback: t.Callable[[int], None] = lambda _: None,
+    ) -> _UploadPlan:
+        """Resolve the content key for `from_ising` and defer the upload.
+
+        The data is only normalized up front when the name is derived from
+        its hash, which is then also the content key; an explicit name is
+        checked against existing files first and has no key.
+        """
+        normalized = None
         if name:
             if (ext_idx := name.find(".")) != -1:
                 name = name[:ext_idx]
-            name += ".h5"
-            if not force and (file := cls.get_file(name=name, problem=problem)):
-                return file
-
-        temp_file_path = None
-        try:
-            with NamedTemporaryFile(delete=False) as temp_file:
-                temp_file_path = Path(temp_file.name)
-
-                cls._write_ising_hdf5(temp_file, biases, couplings, init_state=init_state, offset=offset)
-                temp_file.flush()
-                temp_file_size = temp_file.seek(0, os.SEEK_END)
-                temp_file.seek(0)
-                name = name or (cls._create_hash(temp_file) + ".h5")
+            file_name = name + ".h5"
+        else:
+            normalized = cls._normalize_ising_inputs(biases, couplings, offset=offset)
+            file_name = cls._hash_ising(normalized, init_state=init_state) + ".h5"
+
+        def upload() -> File:
+            with cls._upload_lock(file_name, problem):
+                if not force and (file := cls._find_existing(file_name, problem)):
+                    return file
+                data = normalized
+                if data is None:
+                    data = cls._normalize_ising_inputs(biases, couplings, offset=offset)
+                buffer = io.BytesIO()
+                cls._write_ising_hdf5(buffer, data, init_state=init_state)
+                file_uploader = cls.create_direct(
+                    name=file_name,
+                    size=buffer.seek(0, os.SEEK_END),
+                    problem=problem,
+                    force=force,
+                )
+                return cls._remember(
+                    file_uploader.upload(buffer, callback=upload_callback)
+                )
 
-            if not force and (file := cls.get_file(name=name, problem=problem)):
-                return file
-            file_uploader = cls.create_direct(
-                name=name, size=temp_file_size, problem=problem, force=force
-            )
-            return file_uploader.upload(temp_file_path, callback=upload_callback)
-        finally:
-            if temp_file_path is not None:
-                temp_file_path.unlink(missing_ok=True)
+        return (None if name else file_name), upload
 
     @classmethod
     def from_path(
@@ -915,20 +1214,48 @@ class File(BaseModel):
         Raises:
             FileNotFoundError: If the specified path does not exist.
 
+        """
+        _, upload = cls._plan_path(
+            path, name, problem, force=force, upload_callback=upload_callback
+        )
+        return upload()
+
+    @classmethod
+    def _plan_path(
+        cls,
+        path: Path | str,
+        name: str | None = None,
+        problem: Problem | None = None,
+        *,
+        force: bool = False,
+        upload_callback: t.Callable[[int], None] = lambda _: None,
+    ) -> _UploadPlan:
+        """Check the path for `from_path` and defer the upload.
+
+        Path plans have no content key, since files with the same name may
+        hold different data.
         """
         path = Path(path)
         if not path.exists():
             msg = f"File {path} does not exist."
             raise FileNotFoundError(msg)
-        name = name or path.name
-
-        if not force and (file := cls.get_file(name=name, problem=problem)):
-            return file
+        file_name = name or path.name
+
+        def upload() -> File:
+            with cls._upload_lock(file_name, problem):
+                if not force and (file := cls._find_existing(file_name, problem)):
+                    return file
+                file_uploader = cls.create_direct(
+                    name=file_name,
+                    size=path.stat().st_size,
+                    problem=problem,
+                    force=force,
+                )
+                return cls._remember(
+                    file_uploader.upload(path, callback=upload_callback)
+                )
 
-        file_uploader = cls.create_direct(
-            name=name, size=path.stat().st_size, problem=problem, force=force
-        )
-        return file_uploader.upload(path, callback=upload_callback)
+        return None, upload
 
     @classmethod
     def from_io(
@@ -968,44 +1295,69 @@ class File(BaseModel):
         if name.find(".") == -1:
             name += f".{extension}"
 
-        if not force and (file := cls.get_file(name=name, problem=problem)):
-            return file
+        with cls._upload_lock(name, problem):
+            if not force and (file := cls._find_existing(name, problem)):
+                return file
 
-        new_file = cls.create(
-            name=name, size=data.seek(0, os.SEEK_END), problem=problem, force=force
-        )
-        data.seek(0)
-        new_file.upload(data)
-        return new_file
+            file_uploader = cls.create_direct(
+                name=name, size=data.seek(0, os.SEEK_END), problem=problem, force=force
+            )
+            return cls._remember(
+                file_uploader.upload(data, callback=upload_callback)
+            )
 
     @staticmethod
     def _create_hash(
         file: t.IO,
-        chunk_size: int = 1024,
+        chunk_size: int = 1024 * 1024,
     ) -> str:
         """Create a SHA-256 hash of the file content.
 
+        The digest names content-addressed files, so the algorithm must stay
+        stable for existing uploads to be found again.
+
         Args:
             file (BinaryIO): The file-like object to read from.
-            chunk_size (int): The size of chunks read from the file. Defaults to 1 KB.
+            chunk_size (int): The size of chunks read from the file. Defaults to 1 MB.
 
         Returns:
             str: The hexadecimal hash string of the file contents.
 
         """
         hasher = hashlib.sha256()
-        while chunk := file.read(chunk_size):
+        for chunk in _iter_chunks(file, chunk_size):
             hasher.update(chunk)
         return hasher.hexdigest()
 
+    @staticmethod
+    def _hash_ising(
+        normalized: _NormalizedIsingModel,
+        *,
+        init_state: SampleSet | None = None,
+    ) -> str:
+        """Create a SHA-256 content key for a normalized Ising model.
+
+        Computed before serialization so an instance that is already uploaded
+        is found without building its HDF5 file.
+        """
+        hasher = hashlib.sha256(b"veloxq-ising-v1")
+        arrays = [normalized[key] for key in ("biases", "rows", "cols", "values")]
+        if init_state is not None:
+            arrays += [init_state.record.sample, init_state.record.energy]
+        for array in arrays:
+            data = np.ascontiguousarray(array)
+            hasher.update(f"{data.dtype.str}{data.shape}".encode())
+            hasher.update(data.data)
+        hasher.update("\x00".join(normalized["labels"].tolist()).encode())
+        hasher.update(repr(float(normalized["offset"])).encode())
+        return hasher.hexdigest()
+
     @staticmethod
     def _write_ising_hdf5(
         file: t.IO,
-        biases: BiasesType,
-        couplings: CouplingsType,
+        normalized: _NormalizedIsingModel,
         *,
         init_state: SampleSet | None = None,
-        offset: float = 0.0,
     ) -> None:
         """Serialize Ising data into the solver-compatible HDF5 layout.
 
@@ -1015,7 +1367,7 @@ class File(BaseModel):
         Labels are stored as strings for round-tripping non-integer variables.
         Sparse indices are stored 1-based to match the solver reader.
         """
-        normalized = File._normalize_ising_inputs(biases, couplings, offset=offset)
+        import h5py
 
         size = normalized["size"]
         idx_dtype = normalized["idx_dtype"]
@@ -1029,27 +1381,21 @@ class File(BaseModel):
 
             # Use chunking for better I/O performance on large datasets
             bias_data = normalized["biases"]
-            bias_chunks = None
-            if bias_data.ndim == 1 and bias_data.shape[0] > 1000:
-                bias_chunks = (min(bias_data.shape[0], 10000),)
 
             group.create_dataset(
                 "biases",
                 data=bias_data,
-                chunks=bias_chunks,
+                **_chunked_storage(bias_data),
             )
 
             group.create_dataset("L", data=size, dtype=idx_dtype)
 
             labels_data = normalized["labels"]
-            labels_chunks = None
-            if labels_data.ndim == 1 and labels_data.shape[0] > 1000:
-                labels_chunks = (min(labels_data.shape[0], 10000),)
 
             group.create_dataset(
                 "labels",
                 data=labels_data,
-                chunks=labels_chunks,
+                **_chunked_storage(labels_data),
             )
 
             # Decide sparse vs dense based on coupling density.
@@ -1069,33 +1415,20 @@ class File(BaseModel):
                 cols_data = normalized["cols"]
                 values_data = normalized["values"]
 
-                # Determine chunking for sparse arrays based on actual shapes
-                rows_chunks = None
-                if rows_data.ndim == 1 and rows_data.shape[0] > 1000:
-                    rows_chunks = (min(rows_data.shape[0], 10000),)
-
-                cols_chunks = None
-                if cols_data.ndim == 1 and cols_data.shape[0] > 1000:
-                    cols_chunks = (min(cols_data.shape[0], 10000),)
-
-                values_chunks = None
-                if values_data.ndim == 1 and values_data.shape[0] > 1000:
-                    values_chunks = (min(values_data.shape[0], 10000),)
-
                 couplings_group.create_dataset(
                     "I",
                     data=rows_data,
-                    chunks=rows_chunks,
+                    **_chunked_storage(rows_data),
                 )
                 couplings_group.create_dataset(
                     "J",
                     data=cols_data,
-                    chunks=cols_chunks,
+                    **_chunked_storage(cols_data),
                 )
                 couplings_group.create_dataset(
                     "V",
                     data=values_data,
-                    chunks=values_chunks,
+                    **_chunked_storage(values_data),
                 )
             else:
                 group.attrs["sparsity"] = "dense"
@@ -1105,18 +1438,11 @@ class File(BaseModel):
                     dense[normalized["rows"] - 1, normalized["cols"] - 1] = normalized[
                         "values"
                     ]
-                # Use chunking for large dense matrices
-                dense_chunks = None
-                if dense.ndim == 2:
-                    nrows, ncols = dense.shape
-                    if nrows > 1000 or ncols > 1000:
-                        dense_chunks = (min(nrows, 1000), min(ncols, 1000))
-
                 group.create_dataset(
                     "couplings",
                     data=dense,
                     dtype=dense.dtype,
-                    chunks=dense_chunks,
+                    **_chunked_storage(dense),
                 )
 
             # Include the initial state as spectrum
@@ -1131,32 +1457,22 @@ class File(BaseModel):
                 spectrum.create_dataset("L", data=size, dtype=idx_dtype)
                 spectrum.create_dataset("num_rep", data=np.array(num_rep), dtype=np.int64)
 
-                # Energy chunking based on actual shape - select float32 or float64
+                # Select float32 or float64 for energies
                 max_abs_energy = np.abs(energies).max() if len(energies) > 0 else 0.0
                 energy_dtype = np.float32 if max_abs_energy < 1e7 else np.float64
-                energy_chunks = None
-                if energies.ndim == 1 and energies.shape[0] > 1000:
-                    energy_chunks = (min(energies.shape[0], 1000),)
 
                 spectrum.create_dataset(
                     "energies",
                     data=energies,
                     dtype=energy_dtype,
-                    chunks=energy_chunks,
+                    **_chunked_storage(energies, energy_dtype),
                 )
 
-                # States chunking based on actual 2D shape
-                states_chunks = None
-                if states.ndim == 2:
-                    nrows, ncols = states.shape
-                    if nrows > 1000 or ncols > 1000:
-                        states_chunks = (min(nrows, 1000), min(ncols, 1000))
-
                 spectrum.create_dataset(
                     "states",
                     data=states,
                     dtype=np.int8,  # States are typically -1/+1 or 0/1
-                    chunks=states_chunks,
+                    **_chunked_storage(states, np.int8),
                 )
 
     @staticmethod
@@ -1167,6 +1483,7 @@ class File(BaseModel):
         offset: float = 0.0,
     ) -> _NormalizedIsingModel:
         """Normalize heterogeneous Ising inputs into arrays for HDF5 serialization."""
+        bias_array = None
         if isinstance(biases, (Linear, dict)):
             biases_dict = dict(biases)
         elif isinstance(biases, (list, np.ndarray)):
@@ -1174,7 +1491,6 @@ class File(BaseModel):
             if bias_array.ndim != 1:
                 msg = "Biases array must be one-dimensional or a dict of labels and biases."
                 raise TypeError(msg)
-            biases_dict: dict[VariableType, BiasType] = {i: bias_array[i] for i in range(len(bias_array))}
         else:
             msg = "Unsupported bias type. Expected Linear, dict, list, or ndarray."
             raise TypeError(msg)
@@ -1190,15 +1506,40 @@ class File(BaseModel):
             ):
                 msg = "Couplings array must be square."
                 raise TypeError(msg)
-            # Vectorized extraction of nonzero elements
             nz_rows, nz_cols = np.nonzero(coupling_array)
+            if bias_array is not None and coupling_array.shape[0] <= len(bias_array):
+                # Every variable is already labelled by its bias index, so the
+                # whole instance can be normalized without Python-level loops.
+                return File._normalize_ising_triplets(
+                    bias_array,
+                    nz_rows,
+                    nz_cols,
+                    coupling_array[nz_rows, nz_cols],
+                    offset=offset,
+                )
             coupling_items = [((i, j), coupling_array[i, j]) for i, j in zip(nz_rows, nz_cols)]
+        elif _is_scipy_sparse(couplings):
+            coo = couplings.tocoo(copy=True)
+            if coo.ndim != 2 or coo.shape[0] != coo.shape[1]:
+                msg = "Couplings array must be square."
+                raise TypeError(msg)
+            coo.sum_duplicates()
+            coo.eliminate_zeros()
+            if bias_array is not None and coo.shape[0] <= len(bias_array):
+                return File._normalize_ising_triplets(
+                    bias_array, coo.row, coo.col, coo.data, offset=offset,
+                )
+            coupling_items = list(zip(zip(coo.row.tolist(), coo.col.tolist()), coo.data))
         else:
             msg = (
-                "Unsupported coupling type. Expected Quadratic, dict, list, or ndarray."
+                "Unsupported coupling type. Expected Quadratic, dict, list, "
+                "ndarray, or scipy sparse matrix."
             )
             raise TypeError(msg)
 
+        if bias_array is not None:
+            biases_dict: dict[VariableType, BiasType] = {i: bias_array[i] for i in range(len(bias_array))}
+
         couplings_dict: dict[tuple[VariableType, ...], CouplingType] = {}
         for key, val in coupling_items:
             # Ensure biases exist for all variables in couplings
@@ -1246,7 +1587,6 @@ class File(BaseModel):
         values_list = np.empty(total_entries, dtype=float)
 
         idx = 0
-        max_value = -np.inf
         for key, val in couplings_dict.items():
             if len(key) == 1:
                 u = key[0]
@@ -1270,12 +1610,92 @@ class File(BaseModel):
                 values_list[idx] = val
                 idx += 1
 
-            max_value = max(max_value, abs(val))
+        return File._pack_ising(
+            np.array(list(biases_dict.values()), dtype=float),
+            np.fromiter(map(str, biases_dict.keys()), dtype=np.dtype("T")),
+            rows_list[:idx],
+            cols_list[:idx],
+            values_list[:idx],
+            offset=offset,
+        )
+
+    @staticmethod
+    def _normalize_ising_triplets(
+        bias_array: np.ndarray,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        values: np.ndarray,
+        *,
+        offset: float = 0.0,
+    ) -> _NormalizedIsingModel:
+        """Vectorized normalization for index-labelled instances.
+
+        `rows`, `cols` and `values` are the 0-based nonzero couplings, each
+        position listed once, all indices below `len(bias_array)`. Follows the
+        dict-based path: a pair given on both sides of the diagonal must agree,
+        and a pair given on one side only is mirrored.
+        """
+        size = len(bias_array)
+        if not size:
+            msg = "Empty instance"
+            raise ValueError(msg)
+        idx_dtype: np.dtype[np.integer] = np.min_scalar_type(size)
+
+        rows = rows.astype(np.int64, copy=False)
+        cols = cols.astype(np.int64, copy=False)
+        upper = rows < cols
+        lower = rows > cols
+        upper_keys = rows[upper] * size + cols[upper]
+        lower_keys = cols[lower] * size + rows[lower]
+        upper_values = values[upper]
+        lower_values = values[lower]
+
+        shared, upper_idx, lower_idx = np.intersect1d(
+            upper_keys, lower_keys, assume_unique=True, return_indices=True,
+        )
+        mismatched = ~np.isclose(upper_values[upper_idx], lower_values[lower_idx])
+        if mismatched.any():
+            u, v = np.divmod(shared[mismatched], size)
+            # Report the pair whose lower entry comes first in row-major order.
+            first = np.lexsort((u, v))[0]
+            existing = upper_values[upper_idx[mismatched][first]]
+            val = lower_values[lower_idx[mismatched][first]]
+            msg = (
+                "Symmetric couplings contain mismatched values for pair "
+                f"({u[first]}, {v[first]}): {existing} vs {val}"
+            )
+            raise ValueError(msg)
+
+        # Upper entries come first, so they win for pairs given on both sides.
+        keys, first_idx = np.unique(
+            np.concatenate([upper_keys, lower_keys]), return_index=True,
+        )
+        pair_values = np.concatenate([upper_values, lower_values])[first_idx]
+        pair_rows, pair_cols = np.divmod(keys, size)
+        diag = rows == cols
+
+        return File._pack_ising(
+            bias_array.astype(float),
+            np.fromiter(map(str, range(size)), dtype=np.dtype("T"), count=size),
+            (np.concatenate([rows[diag], pair_rows, pair_cols]) + 1).astype(idx_dtype),
+            (np.concatenate([cols[diag], pair_cols, pair_rows]) + 1).astype(idx_dtype),
+            np.concatenate([values[diag], pair_values, pair_values]).astype(float),
+            offset=offset,
+        )
 
-        # Trim to actual size
-        rows_list = rows_list[:idx]
-        cols_list = cols_list[:idx]
-        values_list = values_list[:idx]
+    @staticmethod
+    def _pack_ising(
+        bias_vals: np.ndarray,
+        labels: np.ndarray,
+        rows_list: np.ndarray,
+        cols_list: np.ndarray,
+        values_list: np.ndarray,
+        *,
+        offset: float = 0.0,
+    ) -> _NormalizedIsingModel:
+        """Sort symmetrized 1-based couplings and pick compact dtypes."""
+        size = len(bias_vals)
+        idx_dtype: np.dtype[np.integer] = np.min_scalar_type(size)
 
         # Sort by column-major order
         order = np.lexsort((rows_list, cols_list))
@@ -1284,21 +1704,18 @@ class File(BaseModel):
 
         # Select float32 or float64 for Solver compatibility
         # Use float32 if values fit, otherwise float64 for precision
-        value_dtype = np.min_scalar_type(max_value if max_value != -np.inf else 0.0)
+        max_value = np.abs(values_list).max() if len(values_list) else 0.0
+        value_dtype = np.min_scalar_type(max_value)
         if value_dtype.kind == "f" and value_dtype.itemsize < 4:
             value_dtype = np.float32
         values_arr = values_list[order].astype(value_dtype)
 
         # Convert biases to array efficiently
-        bias_vals = np.array(list(biases_dict.values()), dtype=float)
         bias_dtype = np.min_scalar_type(np.abs(bias_vals).max())
         if bias_dtype.kind == "f" and bias_dtype.itemsize < 4:
             bias_dtype = np.float32
         bias_arr = bias_vals.astype(bias_dtype)
 
-        # Convert labels to array of strings for HDF5 compatibility
-        labels = np.fromiter(map(str, biases_dict.keys()), dtype=np.dtype("T"))
-
         return {
             "biases": bias_arr,
             "rows": rows_arr,
@@ -1309,3 +1726,15 @@ class File(BaseModel):
             "size": size,
             "offset": offset,
         }
+
+
+# `File.from_instance` loaders by instance type, in isinstance-fallback order.
+_INSTANCE_LOADERS: dict[type, str] = {
+    File: "_plan_file_instance",
+    Path: "_plan_path_instance",
+    type(Path()): "_plan_path_instance",
+    str: "_plan_path_instance",
+    BinaryQuadraticModel: "_plan_bqm_instance",
+    dict: "_plan_dict_instance",
+    tuple: "_plan_tuple_instance",
+}
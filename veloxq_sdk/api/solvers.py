@@ -7,7 +7,10 @@ specified backend, monitoring job execution, and finally retrieving results.
 """
 from __future__ import annotations
 
+import asyncio
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import Field
@@ -27,6 +30,10 @@ if t.TYPE_CHECKING:
         InstanceLike,
     )
 
+# Instances `sample_many` converts and uploads at once; each one in flight
+# holds its serialized file in memory.
+SAMPLE_MANY_MAX_WORKERS = 16
+
 
 class BaseSolver(BaseModel):
     """Base class for all solvers in the VeloxQ API.
@@ -165,6 +172,103 @@ class BaseSolver(BaseModel):
         job.wait_for_completion()
         return job.result
 
+    async def asample(
+        self,
+        *args,
+        name: str | None = None,
+        problem: Problem | None = None,
+        init_state: SampleSet | None = None,
+        force: bool = False,
+        **kwargs,
+    ) -> VeloxSampleSet:
+        """Solve a problem instance without blocking the event loop.
+
+        Accepts the same arguments as `sample`, which runs in a worker thread.
+        Serialization, upload and waiting for the job happen off the event
+        loop, so several instances can be solved concurrently.
+
+        Returns:
+            VeloxSampleSet: An object that provides access to the completed job's results.
+
+        Example:
+            >>> solver = VeloxQSolver()
+            >>> results = await asyncio.gather(
+            ...     solver.asample(instance_1),
+            ...     solver.asample(instance_2),
+            ... )
+
+        """
+        return await asyncio.to_thread(
+            self.sample,
+            *args,
+            name=name,
+            problem=problem,
+            init_state=init_state,
+            force=force,
+            **kwargs,
+        )
+
+    def sample_many(
+        self,
+        instances: t.Iterable[InstanceLike],
+        *,
+        problem: Problem | None = None,
+        force: bool = False,
+    ) -> list[VeloxSampleSet]:
+        """Solve several problem instances with a single job submission.
+
+        Instances are converted to files and uploaded concurrently, at most
+        `SAMPLE_MANY_MAX_WORKERS` at a time, submitted together through
+        `submit_many`, and their results returned once every job has completed.
+        Identical Ising instances are uploaded once, but each still runs as its
+        own job.
+
+        Args:
+            instances (t.Iterable[InstanceLike]): The problem instances to solve.
+                Files are named by content hash, as in `sample` without a name.
+            problem (Problem | None): Optional problem to attach the files to.
+                Defaults to None.
+            force (bool): If True, forces the creation of new files even if they
+                already exist. Defaults to False.
+
+        Returns:
+            list[VeloxSampleSet]: The results, in the order of `instances`.
+
+        Example:
+            >>> solver = VeloxQSolver()
+            >>> results = solver.sample_many([instance_1, instance_2])
+
+        """
+        shared: dict[str, Future[File]] = {}
+        shared_lock = Lock()
+
+        def to_file(instance: InstanceLike) -> File:
+            key, upload = File._plan_instance(instance, problem=problem, force=force)
+            if key is None:
+                return upload()
+            # Identical instances share a content key: upload once and hand
+            # the file to every position that needs it.
+            with shared_lock:
+                future = shared.get(key)
+                owner = future is None
+                if future is None:
+                    future = shared[key] = Future()
+            if owner:
+                try:
+                    future.set_result(upload())
+                except BaseException as error:
+                    future.set_exception(error)
+            return future.result()
+
+        # Each worker plans, serializes and uploads one instance, so memory is
+        # bounded by the worker count instead of the batch size.
+        with ThreadPoolExecutor(max_workers=SAMPLE_MANY_MAX_WORKERS) as executor:
+            files = list(executor.map(to_file, instances))
+        jobs = self.submit_many(files)
+        for job in jobs:
+            job.wait_for_completion()
+        return [job.result for job in jobs]
+
     def submit(self, file: File) -> Job:
         """Submit a file to this solver on the VeloxQ platform.
 
@@ -176,19 +280,72 @@ class BaseSolver(BaseModel):
             and queried for results.
 
         """
-        job_body = {
-            'problemId': file.problem_id,
-            'solvers': [{
-                'solverId': self.id,
-                'backendId': self.backend.id,
-                'files': [{'fileId': file.id}],
-                'parameters': self.parameters.model_dump(
-                    mode='json',
-                ),
-            }],
-        }
-        response = self.http.post('jobs', json=job_body)
-        return Job._from_list_response(response)[0]
+        return self.submit_many([file])[0]
+
+    def submit_many(self, files: t.Sequence[File]) -> list[Job]:
+        """Submit several files to this solver on the VeloxQ platform.
+
+        Files attached to the same problem share one request, so a batch of
+        files costs one round trip per problem instead of one per file. A file
+        listed more than once gets one job per occurrence.
+
+        Args:
+            files (t.Sequence[File]): The files representing the problem instances
+                to be solved.
+
+        Returns:
+            list[Job]: One submitted job per file, in the order of `files`.
+
+        """
+        by_problem: dict[str | None, list[int]] = {}
+        for index, file in enumerate(files):
+            by_problem.setdefault(file.problem_id, []).append(index)
+
+        parameters = self.parameters.model_dump(mode='json')
+        jobs: list[Job | None] = [None] * len(files)
+        for problem_id, indices in by_problem.items():
+            job_body = {
+                'problemId': problem_id,
+                'solvers': [{
+                    'solverId': self.id,
+                    'backendId': self.backend.id,
+                    'files': [{'fileId': files[i].id} for i in indices],
+                    'parameters': parameters,
+                }],
+            }
+            response = self.http.post('jobs', json=job_body)
+            submitted = Job._from_list_response(response)
+            if len(submitted) != len(indices):
+                msg = (
+                    f'Expected {len(indices)} jobs for problem {problem_id}, '
+                    f'got {len(submitted)}.'
+                )
+                raise RuntimeError(msg)
+            for i, job in zip(indices, self._match_jobs(files, indices, submitted)):
+                jobs[i] = job
+        return jobs  # type: ignore[return-value]
+
+    @staticmethod
+    def _match_jobs(
+        files: t.Sequence[File],
+        indices: list[int],
+        submitted: list[Job],
+    ) -> list[Job]:
+        """Order the jobs of one submission like the files at `indices`.
+
+        Jobs are matched through their file, taking repeated files in response
+        order; response order alone is only trusted when jobs carry no file.
+        """
+        if any(job.file is None for job in submitted):
+            return submitted
+        by_file: dict[str, list[Job]] = {}
+        for job in reversed(submitted):
+            by_file.setdefault(job.file.id, []).append(job)  # type: ignore[union-attr]
+        try:
+            return [by_file[files[i].id].pop() for i in indices]
+        except (KeyError, IndexError):
+            msg = 'Submitted jobs do not match the requested files.'
+            raise RuntimeError(msg) from None
 
 
 class VeloxQParameters(PydanticBaseModel):
@@ -231,7 +388,7 @@ class VeloxQSolver(BaseSolver):
 
     id: str = '3bce1dfa-e7af-4040-a283-67cff253cf94'
     backend: BaseBackend = Field(
-        default=VeloxQH100_1(),
+        default_factory=VeloxQH100_1,
         description='The backend to use for the VeloxQ solver.',
     )
     parameters: VeloxQParameters = Field(
@@ -280,7 +437,7 @@ class SBMSolver(BaseSolver):
 
     id: str = '524c60b7-424e-4e12-b155-d7b79a2bc007'
     backend: BaseBackend = Field(
-        default=VeloxQH100_1(),
+        default_factory=VeloxQH100_1,
         description='The backend to use for the VeloxQ SBM solver.',
     )
     parameters: SBMParameters = Field(
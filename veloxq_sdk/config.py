@@ -193,30 +193,38 @@ class VeloxQAPIConfig(SingletonConfigurable):
             path = [path]
         for current in reversed(path):
             # path list is in descending priority order, so load files backwards:
-            pyloader = cls.python_config_loader_class(
-                basefilename + ".py", path=current
-            )
             _logger.debug("Looking for %s in %s", basefilename, current or Path.cwd())
-            jsonloader = cls.json_config_loader_class(
-                basefilename + ".json", path=current
-            )
+            # Resolve the directory the way the loaders' filefind does, so
+            # missing files are skipped without building a loader for them.
+            directory = ""
+            if current:
+                directory = os.path.expandvars(os.path.expanduser(current))  # noqa: PTH111
+            loaders = []
+            for ext, loader_class in (
+                (".py", cls.python_config_loader_class),
+                (".json", cls.json_config_loader_class),
+            ):
+                candidate = os.path.join(directory, basefilename + ext)  # noqa: PTH118
+                if os.path.isfile(candidate):  # noqa: PTH113
+                    loaders.append(loader_class(basefilename + ext, path=current))
             loaded: list[t.Any] = []
             filenames: list[str] = []
-            for loader in [pyloader, jsonloader]:
+            for loader in loaders:
                 if config := cls.__load_config(
                     loader, basefilename, raise_config_file_errors
                 ):
-                    for filename, earlier_config in zip(filenames, loaded):
-                        collisions = earlier_config.collisions(config)
-                        if collisions:
-                            _logger.warning(
-                                "Collisions detected in {0} and {1} config files."  # noqa: G001, UP032
-                                " {1} has higher priority: {2}".format(
+                    if _logger.isEnabledFor(logging.WARNING):
+                        for filename, earlier_config in zip(filenames, loaded):
+                            collisions = earlier_config.collisions(config)
+                            if collisions:
+                                _logger.warning(
+                                    "Collisions detected in %s and %s config files."
+                                    " %s has higher priority: %s",
                                     filename,
                                     loader.full_filename,
+                                    loader.full_filename,
                                     json.dumps(collisions, indent=2),
-                                ),
-                            )
+                                )
                     yield (config, loader.full_filename)
                     loaded.append(config)
                     filenames.append(loader.full_filename)
@@ -265,8 +273,8 @@ def load_config(config: ConfigLike | None = None) -> None:
     elif isinstance(config, Path):
         api_config.load_config_file(config.name, path=str(config.parent))
     elif isinstance(config, str):
-        path = Path(config)
-        api_config.load_config_file(path.name, path=str(path.parent))
+        parent, name = os.path.split(config)
+        api_config.load_config_file(name, path=parent or ".")
     else:
         msg = f"Unsupported config type: {type(config)}. Expected a ConfigLike object."
         raise TypeError(msg)